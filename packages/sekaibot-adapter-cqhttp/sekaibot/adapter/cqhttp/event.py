@@ -1,7 +1,9 @@
 """CQHTTP 适配器事件。"""
 # pyright: reportIncompatibleVariableOverride=false
 
+import sys
 from copy import deepcopy
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Literal, get_args, get_origin
 from typing_extensions import override
 
@@ -16,6 +18,14 @@ if TYPE_CHECKING:
     from . import CQHTTPAdapter
 
 
+@lru_cache(maxsize=4096)
+def _get_session_id(user_id: str, group_id: int | None = None) -> str:
+    """根据用户 id 和群 id 生成会话 id，活跃会话的 id 会被缓存复用。"""
+    if group_id:
+        return sys.intern(f"group_{group_id}_{user_id}")
+    return sys.intern(user_id)
+
+
 class CQHTTPEvent(BaseEvent["CQHTTPAdapter"]):
     """OneBot v11 协议事件，字段与 OneBot 一致。各事件字段参考 [OneBot 文档]
 
@@ -188,9 +198,7 @@ class MessageEvent(CQHTTPEvent):
 
     @override
     def get_session_id(self) -> str:
-        if group_id := getattr(self, "group_id", None):
-            return f"group_{group_id}_{self.get_user_id()}"
-        return self.get_user_id()
+        return _get_session_id(self.get_user_id(), getattr(self, "group_id", None))
 
     @override
     def is_tome(self) -> bool:
@@ -242,9 +250,7 @@ class NoticeEvent(CQHTTPEvent):
 
     @override
     def get_session_id(self) -> str:
-        if group_id := getattr(self, "group_id", None):
-            return f"group_{group_id}_{self.get_user_id()}"
-        return self.get_user_id()
+        return _get_session_id(self.get_user_id(), getattr(self, "group_id", None))
 
 
 class GroupUploadNoticeEvent(NoticeEvent):
@@ -396,9 +402,7 @@ class NotifyEvent(NoticeEvent):
 
     @override
     def get_session_id(self) -> str:
-        if group_id := getattr(self, "group_id", None):
-            return f"group_{group_id}_{self.get_user_id()}"
-        return self.get_user_id()
+        return _get_session_id(self.get_user_id(), getattr(self, "group_id", None))
 
 
 class PokeNotifyEvent(NotifyEvent):
@@ -458,9 +462,7 @@ class RequestEvent(CQHTTPEvent):
 
     @override
     def get_session_id(self) -> str:
-        if group_id := getattr(self, "group_id", None):
-            return f"group_{group_id}_{self.get_user_id()}"
-        return self.get_user_id()
+        return _get_session_id(self.get_user_id(), getattr(self, "group_id", None))
 
     async def approve(self) -> dict[str, Any]:
         """同意请求。
@@ -245,6 +245,12 @@ class CQHTTPMessageSegment(MessageSegment["CQHTTPMessage"]):
         return cls(type="json", data={"data": data})
 
 
+_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "[": "&#91;", "]": "&#93;"})
+_ESCAPE_COMMA_TABLE = str.maketrans(
+    {"&": "&amp;", "[": "&#91;", "]": "&#93;", ",": "&#44;"}
+)
+
+
 def escape(string: str, *, escape_comma: bool = True) -> str:
     """对 CQ 码中的特殊字符进行转义。
 
@@ -255,7 +261,4 @@ def escape(string: str, *, escape_comma: bool = True) -> str:
     Returns:
         转义后的字符串。
     """
-    string = string.replace("&", "&amp;").replace("[", "&#91;").replace("]", "&#93;")
-    if escape_comma:
-        string = string.replace(",", "&#44;")
-    return string
+    return string.translate(_ESCAPE_COMMA_TABLE if escape_comma else _ESCAPE_TABLE)
@@ -7,7 +7,6 @@
 import inspect
 import json
 import sys
-import time
 from collections.abc import Awaitable, Callable
 from functools import partial
 from typing import Any, ClassVar
@@ -16,8 +15,6 @@ from typing_extensions import override
 import aiohttp
 import anyio
 from aiohttp import web
-from anyio.lowlevel import checkpoint
-from pydantic import TypeAdapter
 
 from sekaibot.adapter.utils import WebSocketAdapter
 from sekaibot.internal.message import BuildMessageType
@@ -40,9 +37,26 @@ from .message import OneBotMessage, OneBotMessageSegment
 
 __all__ = ["OneBotAdapter"]
 
+try:
+    # orjson 为可选依赖，安装后用于加速事件和 API 请求 JSON 的解析与序列化
+    from orjson import OPT_NON_STR_KEYS
+    from orjson import dumps as _orjson_dumps
+    from orjson import loads as json_loads
+
+    def json_dumps(obj: Any) -> str:
+        """使用 orjson 序列化 API 请求。"""
+        return _orjson_dumps(
+            obj, default=PydanticEncoder().default, option=OPT_NON_STR_KEYS
+        ).decode()
+
+except ImportError:  # pragma: no cover
+    json_loads = json.loads
+    json_dumps = partial(json.dumps, cls=PydanticEncoder)
+
 
 EventModels = dict[tuple[str | None, str | None, str | None], type[OneBotEvent]]
 
+EVENT_TYPE_KEYS = ("type", "detail_type", "sub_type", "post_type")
 DEFAULT_EVENT_MODELS: EventModels = {}
 for _, model in inspect.getmembers(event, inspect.isclass):
     if issubclass(model, OneBotEvent):
@@ -60,8 +74,8 @@ class OneBotAdapter(WebSocketAdapter[OneBotEvent, Config]):  # type: ignore
     self_id: str = None  # type: ignore
     platform: str = "onebot"
 
-    _api_response: dict[str, Any]
-    _api_response_cond: anyio.Condition
+    _api_responses: dict[int, dict[str, Any]]
+    _api_response_events: dict[int, anyio.Event]
     _api_id: int = 0
 
     def __getattr__(self, item: str) -> Callable[..., Awaitable[Any]]:
@@ -85,7 +99,8 @@ class OneBotAdapter(WebSocketAdapter[OneBotEvent, Config]):  # type: ignore
         self.port = self.config.port
         self.url = self.config.url
         self.reconnect_interval = self.config.reconnect_interval
-        self._api_response_cond = anyio.Condition()
+        self._api_responses = {}
+        self._api_response_events = {}
         await super().startup()
 
     @override
@@ -116,7 +131,7 @@ class OneBotAdapter(WebSocketAdapter[OneBotEvent, Config]):  # type: ignore
         assert self.websocket is not None
         if msg.type == aiohttp.WSMsgType.TEXT:
             try:
-                msg_dict = msg.json()
+                msg_dict = msg.json(loads=json_loads)
             except json.JSONDecodeError:
                 logger.exception("WebSocket message parsing error, not json")
                 return
@@ -124,9 +139,13 @@ class OneBotAdapter(WebSocketAdapter[OneBotEvent, Config]):  # type: ignore
             if "post_type" in msg_dict:
                 await self.handle_onebot_event(msg_dict)
             else:
-                async with self._api_response_cond:
-                    self._api_response = msg_dict
-                    self._api_response_cond.notify_all()
+                # 按 echo 直接唤醒对应的 API 调用，无需唤醒所有等待中的调用
+                api_echo = msg_dict.get("echo")
+                if isinstance(api_echo, int) and (
+                    response_event := self._api_response_events.get(api_echo)
+                ):
+                    self._api_responses[api_echo] = msg_dict
+                    response_event.set()
 
         elif msg.type == aiohttp.WSMsgType.ERROR:
             logger.error(
@@ -178,28 +197,30 @@ class OneBotAdapter(WebSocketAdapter[OneBotEvent, Config]):  # type: ignore
             bot: Bot 对象
             event: MessageEvent 对象
         """
-        try:
-            index = [x.type == "reply" for x in event.message].index(True)
-        except ValueError:
+        index = next(
+            (i for i, x in enumerate(event.message) if x.type == "reply"), None
+        )
+        if index is None:
             return
 
         msg_seg = event.message[index]
 
         try:
-            event.reply = TypeAdapter(Reply).validate_python(msg_seg.data)
+            event.reply = Reply.model_validate(msg_seg.data)
         except Exception as e:
-            logger.warning(f"Error when getting message reply info: {e!r}", exc_info=e)
+            logger.warning("Error when getting message reply info: %r", e, exc_info=e)
             return
 
         # ensure string comparation
-        if str(event.reply.user_id) == str(event.self.user_id):
+        reply_user_id = str(event.reply.user_id)
+        if reply_user_id == str(event.self.user_id):
             event.to_me = True
         del event.message[index]
 
         if (
             len(event.message) > index
             and event.message[index].type == "mention"
-            and event.message[index].data.get("user_id") == str(event.reply.user_id)
+            and event.message[index].data.get("user_id") == reply_user_id
         ):
             del event.message[index]
 
@@ -230,11 +251,12 @@ class OneBotAdapter(WebSocketAdapter[OneBotEvent, Config]):  # type: ignore
         if event.detail_type == "private":
             event.to_me = True
         else:
+            self_id = event.self.user_id
 
             def _is_mention_me_seg(segment: OneBotMessageSegment) -> bool:
                 return (
                     segment.type == "mention"
-                    and str(segment.data.get("user_id", "")) == event.self.user_id
+                    and str(segment.data.get("user_id", "")) == self_id
                 )
 
             # check the first segment
@@ -284,6 +306,12 @@ class OneBotAdapter(WebSocketAdapter[OneBotEvent, Config]):  # type: ignore
         self.self_id = msg.get("self_id")
         self.platform = msg.get("platform", "onebot")
 
+        # 驻留事件类型字符串，使事件模型查找和之后的类型比较可以直接命中对象标识
+        for key in EVENT_TYPE_KEYS:
+            value = msg.get(key)
+            if isinstance(value, str):
+                msg[key] = sys.intern(value)
+
         post_type = msg.get("post_type")
         if post_type is None:
             event_class = self.get_event_model(None, None, None)
@@ -337,46 +365,36 @@ class OneBotAdapter(WebSocketAdapter[OneBotEvent, Config]):  # type: ignore
         """
         assert self.websocket is not None
         api_echo = self._get_api_echo()
+        response_event = self._api_response_events[api_echo] = anyio.Event()
         try:
-            await self.websocket.send_str(
-                json.dumps(
-                    {
-                        "action": api,
-                        "params": params,
-                        "echo": api_echo,
-                        "self": {
-                            "platform": self.platform,
-                            "self_id": self.self_id,
-                        },
-                    },
-                    cls=PydanticEncoder,
+            try:
+                await self.websocket.send_str(
+                    json_dumps(
+                        {
+                            "action": api,
+                            "params": params,
+                            "echo": api_echo,
+                            "self": {
+                                "platform": self.platform,
+                                "self_id": self.self_id,
+                            },
+                        }
+                    )
                 )
-            )
-        except Exception as e:
-            raise NetworkError from e
-
-        start_time = time.time()
-        while True:
-            await checkpoint()
-            if time.time() - start_time > self.config.api_timeout:
-                break
-            async with self._api_response_cond:
-                try:
-                    with anyio.fail_after(
-                        start_time + self.config.api_timeout - time.time()
-                    ):
-                        await self._api_response_cond.wait()
-                except TimeoutError:
-                    break
-                if self._api_response["echo"] == api_echo:
-                    if (
-                        self._api_response.get("retcode") != 0
-                        or self._api_response.get("status") == "failed"
-                    ):
-                        raise ActionFailed(resp=self._api_response)
-                    return self._api_response.get("data")
-
-        raise ApiTimeout
+            except Exception as e:
+                raise NetworkError from e
+
+            with anyio.move_on_after(self.config.api_timeout):
+                await response_event.wait()
+        finally:
+            del self._api_response_events[api_echo]
+            api_response = self._api_responses.pop(api_echo, None)
+
+        if api_response is None:
+            raise ApiTimeout
+        if api_response.get("retcode") != 0 or api_response.get("status") == "failed":
+            raise ActionFailed(resp=api_response)
+        return api_response.get("data")
 
     @override
     async def send(  # type: ignore
@@ -388,7 +406,8 @@ class OneBotAdapter(WebSocketAdapter[OneBotEvent, Config]):  # type: ignore
         **params: Any,
     ) -> Any:
         """默认回复消息处理函数。"""
-        event_dict = event.model_dump()
+        # 仅读取少量标量字段，浅合并即可，避免 model_dump() 深度序列化整个事件
+        event_dict = {**event.__dict__, **(event.model_extra or {})}
 
         params.setdefault("detail_type", event_dict["detail_type"])
 
@@ -127,14 +127,14 @@ class Adapter(ABC, Generic[EventT, ConfigT]):
     async def startup(self) -> None:
         """在适配器开始运行前运行的方法，用于初始化适配器。
 
-        AliceBot 依次运行并等待所有适配器的 `startup()` 方法，待运行完毕后再创建 `run()` 任务。
+        AliceBot 并发运行并等待所有适配器的 `startup()` 方法，待运行完毕后再创建 `run()` 任务。
         """
 
     async def shutdown(self) -> None:
         """在适配器结束运行时运行的方法，用于安全地关闭适配器。
 
         AliceBot 在接收到系统的结束信号后先发送 cancel 请求给 run 任务。
-        在所有适配器都停止运行后，会依次运行并等待所有适配器的 `shutdown()` 方法。
+        在所有适配器都停止运行后，会并发运行并等待所有适配器的 `shutdown()` 方法。
         当强制退出时此方法可能未被执行。
         """
 
@@ -184,7 +184,7 @@ class Adapter(ABC, Generic[EventT, ConfigT]):
                 result = excs[0].result  # type: ignore
 
                 logger.debug(
-                    f"Calling API {api} is cancelled. Return {result!r} instead."
+                    "Calling API %s is cancelled. Return %r instead.", api, result
                 )
 
             with catch(
@@ -228,7 +228,7 @@ class Adapter(ABC, Generic[EventT, ConfigT]):
                 result = excs[0].result  # type: ignore
                 exception = None
                 logger.debug(
-                    f"Calling API {api} result is mocked. Return {result} instead."
+                    "Calling API %s result is mocked. Return %s instead.", api, result
                 )
 
             with catch(
@@ -59,13 +59,14 @@ class WebSocketClientAdapter(Adapter[EventT, ConfigT], metaclass=ABCMeta):  # ty
     """WebSocket 客户端适配器示例。"""
 
     url: str
+    session: aiohttp.ClientSession | None = None
 
     @override
     async def run(self) -> None:
-        async with (
-            aiohttp.ClientSession() as session,
-            session.ws_connect(self.url) as ws,
-        ):
+        # 复用同一个会话，重连时无需重建连接池和 DNS 缓存
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession()
+        async with self.session.ws_connect(self.url) as ws:
             msg: aiohttp.WSMessage
             async for msg in ws:
                 await checkpoint()
@@ -73,6 +74,11 @@ class WebSocketClientAdapter(Adapter[EventT, ConfigT], metaclass=ABCMeta):  # ty
                     break
                 await self.handle_response(msg)
 
+    @override
+    async def shutdown(self) -> None:
+        if self.session is not None:
+            await self.session.close()
+
     @abstractmethod
     async def handle_response(self, msg: aiohttp.WSMessage) -> None:
         """处理响应。"""
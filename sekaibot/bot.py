@@ -3,21 +3,21 @@
 SekaiBot 的基础模块，每一个 SekaiBot 机器人即是一个 `Bot` 实例。
 """
 
+import hashlib
 import inspect
 import json
-import pkgutil
+import os
 import signal
 import sys
 import threading
-import tomllib
 from collections import defaultdict
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any, ClassVar, overload
 
 import anyio
-import yaml
 from exceptiongroup import catch
-from pydantic import ValidationError, create_model
+from pydantic import Field, ValidationError, create_model
 
 from sekaibot.adapter import Adapter
 from sekaibot.config import (
@@ -84,6 +84,16 @@ class Bot:
     _restart_flag: bool  # 重启标记
     _module_path_finder: ModulePathFinder  # 用于查找 nodes 的模块元路径查找器
     _raw_config_dict: dict[str, Any]  # 原始配置字典
+    _nodes_index: tuple[
+        list[tuple[type[Node[Any, Any, Any]], int]], int, dict[str, int]
+    ]  # 节点名称到 nodes_list 下标的映射缓存
+    _config_file_cache: (
+        tuple[tuple[str, int, int, int], bytes, dict[str, Any]] | None
+    )  # 配置文件解析缓存
+    _config_model_cache: dict[
+        tuple[str, type[ConfigModel], frozenset[tuple[str, Any]]], type[ConfigModel]
+    ]  # 动态配置模型缓存
+    _config_default_cache: dict[type[ConfigModel], Any]  # 配置类默认值缓存
 
     _config_file: str | None  # 配置文件
     _config_dict: dict[str, Any] | None  # 配置
@@ -153,6 +163,7 @@ class Bot:
         self.manager = NodeManager(self)
         self.nodes_tree = {}
         self.nodes_list = []
+        self._nodes_index = (self.nodes_list, 0, {})
         self.node_state = defaultdict(lambda: None)
         self.adapters = []
         self.plugin_dict = {}
@@ -178,6 +189,9 @@ class Bot:
         self._config_file = config_file
         self._config_dict = config_dict
         self._raw_config_dict = {}
+        self._config_file_cache = None
+        self._config_model_cache = {}
+        self._config_default_cache = {}
         self._handle_signals = handle_signals
 
         sys.meta_path.insert(0, self._module_path_finder)
@@ -186,7 +200,7 @@ class Bot:
         if not hooks:
             return
 
-        logger.debug(f"Running {name}...")
+        logger.debug("Running %s...", name)
 
         with catch({Exception: handle_exception(f"Error when running {name}")}):
             async with anyio.create_task_group() as tg:
@@ -211,7 +225,7 @@ class Bot:
         if not hooks:
             return
 
-        logger.debug(f"Running {name}...", adapter=adapter)
+        logger.debug("Running %s...", name, adapter=adapter)
 
         with catch(
             {Exception: handle_exception(f"Error when running {name}", adapter=adapter)}
@@ -238,9 +252,37 @@ class Bot:
 
         return [_node for _node, _ in self.nodes_list]
 
-    def run(self) -> None:
-        """运行 SekaiBot。"""
-        anyio.run(self.arun)
+    @property
+    def nodes_index(self) -> dict[str, int]:
+        """节点名称到其在 `nodes_list` 中下标的映射。
+
+        仅在 `nodes_list` 发生变化时重新构建。
+        """
+        if self.nodes_tree and not self.nodes_list:
+            self.nodes_list = flatten_tree_with_jumps(self.nodes_tree)
+
+        nodes_list, length, index_map = self._nodes_index
+        if nodes_list is not self.nodes_list or length != len(nodes_list):
+            index_map = {
+                _node.__name__: i for i, (_node, _) in enumerate(self.nodes_list)
+            }
+            self._nodes_index = (self.nodes_list, len(self.nodes_list), index_map)
+        return index_map
+
+    def run(
+        self,
+        *,
+        backend: str = "asyncio",
+        backend_options: dict[str, Any] | None = None,
+    ) -> None:
+        """运行 SekaiBot。
+
+        Args:
+            backend: 使用的异步后端，可选 `"asyncio"` 或 `"trio"`。
+            backend_options: 传递给异步后端的选项，
+                如 `{"use_uvloop": True}` 可在安装 `uvloop` 后使用其事件循环。
+        """
+        anyio.run(self.arun, backend=backend, backend_options=backend_options)
 
     async def arun(self) -> None:
         """异步运行 SekaiBot。"""
@@ -251,9 +293,11 @@ class Bot:
             self._load_config_dict()
             await self.startup()
             async with anyio.create_task_group() as tg:
-                tg.start_soon(self._run)
                 if self._handle_signals:  # pragma: no cover
                     tg.start_soon(self._handle_exit_signal)
+                await self._run()
+                # _run() 结束后信号处理任务不会自行退出，需主动取消
+                tg.cancel_scope.cancel()
             if self._restart_flag:
                 self._load_nodes(*self._extend_nodes)
                 self._load_nodes_from_dirs(*self._extend_node_dirs)
@@ -269,17 +313,18 @@ class Bot:
     async def startup(self) -> None:
         """加载或重加载 SekaiBot 的所有加载项"""
         self.nodes_tree.clear()
-        self.nodes_list.clear()
+        self.nodes_list = []
 
         self._load_nodes_from_dirs(*self.config.bot.node_dirs)
         self._load_nodes(*self.config.bot.nodes)
         self._load_adapters(*self.config.bot.adapters)
         self.load_plugins()
 
-        await self._run_bot_hooks(self._bot_startup_hooks, "BotStartupHooks")
-
+        # 启动钩子需要看到已合并节点、适配器和插件配置的完整配置
         self._update_config()
 
+        await self._run_bot_hooks(self._bot_startup_hooks, "BotStartupHooks")
+
     async def _run(self) -> None:
         """运行 SekaiBot。"""
         # 启动 SekaiBot
@@ -290,14 +335,10 @@ class Bot:
         async with anyio.create_task_group() as tg:
             tg.start_soon(cancel_on_exit, self._should_exit, tg.cancel_scope)
 
-            for _adapter in self.adapters:
-                await self._run_adapter_hooks(
-                    self._adapter_startup_hooks, _adapter, "AdapterStartupHooks"
-                )
-                try:
-                    await _adapter.startup()
-                except Exception:
-                    logger.exception("Startup adapter failed", adapter=_adapter)
+            # 各适配器的启动互不依赖，并发执行以避免串行等待网络连接
+            async with anyio.create_task_group() as startup_tg:
+                for _adapter in self.adapters:
+                    startup_tg.start_soon(self._startup_adapter, _adapter)
 
             try:
                 await self.manager.startup()
@@ -313,20 +354,46 @@ class Bot:
 
                 tg.start_soon(self.manager.safe_run)
 
-        for _adapter in self.adapters:
-            await self._run_adapter_hooks(
-                self._adapter_shutdown_hooks, _adapter, "AdapterShutdownHooks"
-            )
-            await _adapter.shutdown()
+        async with anyio.create_task_group() as shutdown_tg:
+            for _adapter in self.adapters:
+                shutdown_tg.start_soon(self._shutdown_adapter, _adapter)
 
         await self.manager.shutdown()
 
         await self._run_bot_hooks(self._bot_exit_hooks, "BotExitHooks")
 
         self.nodes_tree.clear()
-        self.nodes_list.clear()
+        self.nodes_list = []
         self._module_path_finder.path.clear()
 
+    async def _startup_adapter(self, adapter: Adapter[Any, Any]) -> None:
+        """运行适配器启动钩子并启动适配器。
+
+        Args:
+            adapter: 要启动的适配器。
+        """
+        await self._run_adapter_hooks(
+            self._adapter_startup_hooks, adapter, "AdapterStartupHooks"
+        )
+        try:
+            await adapter.startup()
+        except Exception:
+            logger.exception("Startup adapter failed", adapter=adapter)
+
+    async def _shutdown_adapter(self, adapter: Adapter[Any, Any]) -> None:
+        """运行适配器关闭钩子并关闭适配器。
+
+        Args:
+            adapter: 要关闭的适配器。
+        """
+        await self._run_adapter_hooks(
+            self._adapter_shutdown_hooks, adapter, "AdapterShutdownHooks"
+        )
+        try:
+            await adapter.shutdown()
+        except Exception:
+            logger.exception("Shutdown adapter failed", adapter=adapter)
+
     async def _handle_exit_signal(self) -> None:  # pragma: no cover
         """根据平台不同注册信号处理程序。"""
         if threading.current_thread() is not threading.main_thread():
@@ -352,6 +419,11 @@ class Bot:
 
     def _update_config(self) -> None:
         """更新 config，合并入来自 Node 和 Adapter 的 Config。"""
+        # 每次更新只保留本次仍在使用的缓存项，重载后旧的配置类及其模块不会被一直引用
+        old_model_cache = self._config_model_cache
+        old_default_cache = self._config_default_cache
+        self._config_model_cache = {}
+        self._config_default_cache = {}
 
         def update_config(
             source: list[type[Node[Any, Any, Any]]]
@@ -359,31 +431,59 @@ class Bot:
             | list[Adapter[Any, Any]],
             name: str,
             base: type[ConfigModel],
-        ) -> tuple[type[ConfigModel], ConfigModel]:
+        ) -> tuple[type[ConfigModel], Any]:
             config_update_dict: dict[str, Any] = {}
             for i in source:
                 config_class = getattr(i, "Config", None)
                 if is_config_class(config_class):
-                    default_value: Any
-                    try:
-                        default_value = config_class()
-                    except ValidationError:
-                        default_value = ...
                     config_update_dict[config_class.__config_name__] = (
                         config_class,
-                        default_value,
+                        get_default_value(config_class),
                     )
-            config_model = create_model(name, **config_update_dict, __base__=base)
-            return config_model, config_model()
+            config_model = get_config_model(name, base, config_update_dict)
+            # 使用默认值工厂，仅在原始配置缺少该部分时才实例化默认配置
+            return config_model, Field(default_factory=config_model)
+
+        def get_default_value(config_class: type[ConfigModel]) -> Any:
+            # 每个配置类只实例化探测一次默认值，必填字段缺失时使用 ...
+            default_value: Any
+            if config_class in old_default_cache:
+                default_value = old_default_cache[config_class]
+            else:
+                try:
+                    default_value = config_class()
+                except ValidationError:
+                    default_value = ...
+            self._config_default_cache[config_class] = default_value
+            return default_value
+
+        def get_config_model(
+            name: str, base: type[ConfigModel], fields: dict[str, Any]
+        ) -> type[ConfigModel]:
+            # 只要参与合并的配置类不变，就复用上一次动态创建的配置模型
+            key = (
+                name,
+                base,
+                frozenset(
+                    (k, v[0] if isinstance(v, tuple) else v) for k, v in fields.items()
+                ),
+            )
+            config_model = old_model_cache.get(key)
+            if config_model is None:
+                config_model = create_model(name, **fields, __base__=base)
+            self._config_model_cache[key] = config_model
+            return config_model
 
-        self.config = create_model(
+        self.config = get_config_model(
             "Config",
-            node=update_config(self.nodes, "NodeConfig", NodeConfig),
-            plugin=update_config(
-                list(self.plugin_dict.values()), "PluginConfig", PluginConfig
-            ),
-            adapter=update_config(self.adapters, "AdapterConfig", AdapterConfig),
-            __base__=MainConfig,
+            MainConfig,
+            {
+                "node": update_config(self.nodes, "NodeConfig", NodeConfig),
+                "plugin": update_config(
+                    list(self.plugin_dict.values()), "PluginConfig", PluginConfig
+                ),
+                "adapter": update_config(self.adapters, "AdapterConfig", AdapterConfig),
+            },
         )(**self._raw_config_dict)
 
         configure_logging(
@@ -398,25 +498,17 @@ class Bot:
             self._raw_config_dict = self._config_dict
         elif self._config_file is not None:
             try:
-                with Path(self._config_file).open("rb") as f:
-                    if self._config_file.endswith(".json"):
-                        self._raw_config_dict = json.load(f)
-                    elif self._config_file.endswith(".toml"):
-                        self._raw_config_dict = tomllib.load(f)
-                    elif self._config_file.endswith((".yml", ".yaml")):
-                        self._raw_config_dict = yaml.safe_load(f)
-                    else:
-                        logger.error(
-                            "Read config file failed: Unable to determine config file type"
-                        )
+                raw_config_dict = self._read_config_file(self._config_file)
+                if raw_config_dict is None:
+                    logger.error(
+                        "Read config file failed: Unable to determine config file type"
+                    )
+                else:
+                    self._raw_config_dict = raw_config_dict
             except OSError:
                 logger.exception("Can not open config file:")
-            except (
-                ValueError,
-                json.JSONDecodeError,
-                tomllib.TOMLDecodeError,
-                yaml.YAMLError,
-            ):
+            except ValueError:
+                # json.JSONDecodeError 和 tomllib.TOMLDecodeError 均为 ValueError 的子类
                 logger.exception("Read config file failed:")
 
         try:
@@ -425,7 +517,61 @@ class Bot:
             self.config = MainConfig()
             logger.exception("Config dict parse error")
 
-        self._update_config()
+        # 完整的配置模型会在 startup() 加载完节点、适配器和插件后再构建并校验，
+        # 此处只需应用日志配置，避免对同一份原始配置重复校验。
+        configure_logging(
+            self.config.bot.log.level, self.config.bot.log.verbose_exception
+        )
+
+    def _read_config_file(self, config_file: str) -> dict[str, Any] | None:
+        """读取并解析配置文件，文件未发生变化时直接复用上一次的解析结果。
+
+        先比较文件路径、inode、修改时间和大小，不一致时再比较同一路径下文件内容的摘要，
+        两者均未变化时跳过解析。
+
+        Args:
+            config_file: 配置文件路径。
+
+        Returns:
+            解析得到的配置字典，无法识别配置文件类型时返回 `None`。
+        """
+        path = Path(config_file)
+        stat = path.stat()
+        stamp = (config_file, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        cache = self._config_file_cache
+        if cache is not None and cache[0] == stamp:
+            return cache[2]
+        if cache is not None and cache[0][0] != config_file:
+            cache = None
+
+        with path.open("rb") as f:
+            # 分块计算摘要后直接从同一个文件对象解析，不在内存中保留额外的文件副本
+            digest = hashlib.file_digest(
+                f, lambda: hashlib.blake2b(digest_size=16)
+            ).digest()
+            if cache is not None and cache[1] == digest:
+                self._config_file_cache = (stamp, digest, cache[2])
+                return cache[2]
+
+            f.seek(0)
+            if config_file.endswith(".json"):
+                raw_config_dict = json.load(f)
+            elif config_file.endswith(".toml"):
+                import tomllib
+
+                raw_config_dict = tomllib.load(f)
+            elif config_file.endswith((".yml", ".yaml")):
+                import yaml
+
+                try:
+                    raw_config_dict = yaml.safe_load(f)
+                except yaml.YAMLError as e:
+                    raise ValueError("Invalid YAML config file") from e
+            else:
+                return None
+
+        self._config_file_cache = (stamp, digest, raw_config_dict)
+        return raw_config_dict
 
     def _load_node_classes(
         self,
@@ -509,6 +655,52 @@ class Bot:
             ]
             self._load_node_classes(*nodes)
 
+    def _get_search_dir_ids(self) -> set[tuple[int, int]]:
+        """获取所有模块搜索路径的 `(st_dev, st_ino)`，忽略无法访问的路径。"""
+        search_dir_ids: set[tuple[int, int]] = set()
+        for path in self._module_path_finder.path:
+            try:
+                path_stat = Path(path).stat()
+            except OSError:
+                continue
+            search_dir_ids.add((path_stat.st_dev, path_stat.st_ino))
+        return search_dir_ids
+
+    @staticmethod
+    def _get_node_module_name(
+        node_path: Path, search_dir_ids: set[tuple[int, int]]
+    ) -> str:
+        """根据节点文件路径推断其模块名称。
+
+        Args:
+            node_path: 节点模块文件路径。
+            search_dir_ids: 模块搜索路径的 `(st_dev, st_ino)` 集合。
+
+        Returns:
+            节点模块名称。
+        """
+        # 只解析一次路径，包的 __init__.py 需要与其上级目录比较
+        resolved_path = node_path.resolve()
+        if node_path.stem == "__init__":
+            search_dir = resolved_path.parent.parent
+            module_stem = resolved_path.parent.name
+        else:
+            search_dir = resolved_path.parent
+            module_stem = node_path.stem
+
+        try:
+            dir_stat = search_dir.stat()
+        except OSError:
+            pass
+        else:
+            if (dir_stat.st_dev, dir_stat.st_ino) in search_dir_ids:
+                return module_stem
+
+        rel_path = resolved_path.relative_to(Path().cwd())
+        if rel_path.stem == "__init__":
+            return ".".join(rel_path.parts[:-1])
+        return ".".join(rel_path.parts[:-1] + (rel_path.stem,))
+
     def _load_nodes(
         self,
         *nodes: type[Node[Any, Any, Any]] | str | Path,
@@ -529,6 +721,8 @@ class Bot:
         """
         node_classes: list[type[Node[Any, Any, Any]]] = []
         module_names: list[str] = []
+        # 模块搜索路径的 (st_dev, st_ino)，仅在加载路径类型的节点时计算一次
+        search_dir_ids: set[tuple[int, int]] | None = None
 
         for node_ in nodes:
             try:
@@ -546,28 +740,11 @@ class Bot:
                     if node_.suffix != ".py":
                         raise LoadModuleError(f'The path "{node_}" must endswith ".py"')
 
-                    node_module_name = None
-                    for path in self._module_path_finder.path:
-                        try:
-                            if node_.stem == "__init__":
-                                if node_.resolve().parent.parent.samefile(Path(path)):
-                                    node_module_name = node_.resolve().parent.name
-                                    break
-                            elif node_.resolve().parent.samefile(Path(path)):
-                                node_module_name = node_.stem
-                                break
-                        except OSError:
-                            continue
-                    if node_module_name is None:
-                        rel_path = node_.resolve().relative_to(Path().cwd())
-                        if rel_path.stem == "__init__":
-                            node_module_name = ".".join(rel_path.parts[:-1])
-                        else:
-                            node_module_name = ".".join(
-                                rel_path.parts[:-1] + (rel_path.stem,)
-                            )
-
-                    module_names.append(node_module_name)
+                    if search_dir_ids is None:
+                        search_dir_ids = self._get_search_dir_ids()
+                    module_names.append(
+                        self._get_node_module_name(node_, search_dir_ids)
+                    )
                 else:
                     raise TypeError(f"{node_} can not be loaded as node")
             except Exception:
@@ -615,14 +792,59 @@ class Bot:
         dir_list = [str(x.resolve()) for x in dirs]
         logger.info("Loading nodes from dirs", dirs=", ".join(map(str, dir_list)))
         self._module_path_finder.path.extend(dir_list)
-        module_name = list(
-            filter(
-                lambda name: not name.startswith("_"),
-                (module_info.name for module_info in pkgutil.iter_modules(dir_list)),
-            )
-        )
+        module_name = [
+            name
+            for name in self._iter_module_names(dir_list)
+            if not name.startswith("_")
+        ]
         self._load_nodes_from_module_name(*module_name, node_load_type=NodeLoadType.DIR)
 
+    @staticmethod
+    def _iter_module_names(dir_list: list[str]) -> Iterator[str]:
+        """按名称顺序列出目录中的顶层模块和包，同名模块只返回第一个。
+
+        与 `pkgutil.iter_modules()` 的结果一致，但直接使用 `os.scandir()`，
+        无需为每个目录创建导入查找器。
+
+        Args:
+            dir_list: 目录路径列表。
+
+        Yields:
+            模块名称。
+        """
+        yielded: set[str] = set()
+        for dir_path in dir_list:
+            try:
+                with os.scandir(dir_path) as it:
+                    entries = sorted(it, key=lambda entry: entry.name)
+            except OSError:
+                continue
+            for entry in entries:
+                name = inspect.getmodulename(entry.name)
+                if name is None:
+                    if (
+                        "." in entry.name
+                        or not entry.is_dir()
+                        or not Bot._is_package_dir(entry.path)
+                    ):
+                        continue
+                    name = entry.name
+                if name == "__init__" or "." in name or name in yielded:
+                    continue
+                yielded.add(name)
+                yield name
+
+    @staticmethod
+    def _is_package_dir(path: str) -> bool:
+        """判断目录是否为包，`__init__` 可以是源码、字节码或扩展模块。"""
+        try:
+            with os.scandir(path) as it:
+                return any(
+                    inspect.getmodulename(entry.name) == "__init__" for entry in it
+                )
+        except OSError:
+            return False
+
     def load_nodes_from_dirs(self, *dirs: Path) -> None:
         """从目录中加载节点，以 `_` 开头的模块中的节点不会被导入。路径可以是相对路径或绝对路径。
 
@@ -645,10 +867,10 @@ class Bot:
         Raises:
             LookupError: 找不到此名称的插件类。
         """
-        for _plugin in self.nodes:
-            if _plugin.__name__ == name:
-                return _plugin
-        raise LookupError(f'Can not find node named "{name}"')
+        index = self.nodes_index.get(name)
+        if index is None:
+            raise LookupError(f'Can not find node named "{name}"')
+        return self.nodes_list[index][0]
 
     def load_plugins(self) -> None:
         """加载插件。"""
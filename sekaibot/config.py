@@ -50,129 +50,6 @@ class BotConfig(ConfigModel):
     log: LogConfig = LogConfig()
 
 
-'''
-class LLMConfig(ConfigModel):
-    """LLM 配置。
-
-    Attributes:
-    """
-
-    llm_type: Literal["openai"] = "openai"
-    api_key: str = "sk-dFzsKInVuNhZhAt8KpV4qXhyWeFbME0RYxiGJLXjDHrhirkb"  # os.getenv("OPENAI_API_KEY", "your-openai-api-key")
-    base_url: str = "https://api.chatanywhere.tech/v1"
-    model: str = "gpt-4o-mini"
-
-
-class ToolConfig(ConfigModel):
-    """Tool 配置。
-
-    Attributes:
-    """
-
-    tools: set[str] = Field(default_factory=set)
-    tool_dirs: set[DirectoryPath] = Field(default_factory=set)
-
-
-class PromptConfig(ConfigModel):
-    """角色信息配置。
-
-    Attributes:
-        name: 角色名字
-        role_definition: 角色定义
-        symbol_conversation: 角色对话样例
-    """
-
-    name: str | None = "Sekai"
-    role_definition: str | None = (
-        "你是一个善解人意、幽默风趣的AI助理，会根据用户的上下文对话内容进行自然回答。"
-        "请注意对话场景的合理性，并结合用户和系统信息。"
-    )
-    symbol_conversation: list[dict[str, str | list[str | dict]]] | None = [
-        {"input": "你好", "output": "你好，很高兴能帮助你"}
-    ]
-
-
-class AgentConfig(ConfigModel):
-    """Agent 配置。
-
-    Attributes:
-
-    """
-
-    llm: LLMConfig = LLMConfig()
-    tool: ToolConfig = ToolConfig()
-    prompt: PromptConfig = PromptConfig()
-
-
-class SQLConfig(ConfigModel):
-    """SQL 配置。
-    Attributes:
-        connection_string: String parameter configuration for connecting
-            to the database.
-        table_name: Table name used to save data.
-        session_id_field_name: The name of field of `session_id`.
-        engine_args: Additional configuration for creating database engines.
-        async_mode: Whether it is an asynchronous connection.
-    """
-
-    db_type: Literal["sql"]
-    connection_string: str | None = (None,)
-    table_name: str = ("message_store",)
-    session_id_field_name: str = ("session_id",)
-    engine_args: dict[str, Any] | None = (None,)
-    async_mode: bool | None = (None,)
-
-
-class RedisConfig(ConfigModel):
-    """Redis 配置。
-
-    Attributes:
-        url: String parameter configuration for connecting to the redis.
-        key_prefix: The prefix of the key, combined with `session id` to form the key.
-        ttl: set the expiration time of `key`, the unit is seconds.
-    """
-
-    db_type: Literal["redis"]
-    url: str = "redis://localhost:6379/0"
-    key_prefix: str = "message_store:"
-    ttl: int | None = None
-
-
-class MongoDBConfig(ConfigModel):
-    """MongoDB 配置。
-
-    Attributes:
-        connection_string: connection string to connect to MongoDB
-        database_name: name of the database to use
-        collection_name: name of the collection to use
-        create_index: whether to create an index with name SessionId. set to False if
-            such an index already exists.
-    """
-
-    db_type: Literal["mongodb"]
-    connection_string: str
-    session_id: str
-    database_name: str = "chat_history"
-    collection_name: str = "message_store"
-    create_index: bool = True
-
-
-DatabaseConfigType = Annotated[
-    SQLConfig | RedisConfig | MongoDBConfig,
-    Field(discriminator="db_type"),
-]
-
-
-class DatabaseConfig(ConfigModel):
-    """Database 配置。
-
-    Attributes:
-        config: SQLConfig | RedisConfig | MongoDBConfig
-    """
-
-    config: DatabaseConfigType'''
-
-
 class AdapterConfig(ConfigModel):
     """适配器配置。"""
 
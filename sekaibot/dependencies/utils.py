@@ -12,22 +12,23 @@ from contextlib import (
     asynccontextmanager,
     contextmanager,
 )
-from typing import Any, TypeVar, Union, cast, get_type_hints
+from functools import lru_cache
+from typing import Any, TypeVar, cast, get_type_hints
 from typing_extensions import override
 
 from sekaibot.utils import get_annotations, sync_ctx_manager_wrapper
 
 _T = TypeVar("_T")
-Dependency = Union[  # noqa: UP007
+Dependency = (
     # Class-based dependencies
-    type[_T | AbstractAsyncContextManager[_T] | AbstractContextManager[_T]],
+    type[_T | AbstractAsyncContextManager[_T] | AbstractContextManager[_T]]
     # Generator-based dependencies
-    Callable[[], AsyncGenerator[_T, None]],
-    Callable[[], Generator[_T, None, None]],
+    | Callable[[], AsyncGenerator[_T, None]]
+    | Callable[[], Generator[_T, None, None]]
     # Function-based dependencies
-    Callable[..., _T],
-    Callable[..., Awaitable[_T]],
-]
+    | Callable[..., _T]
+    | Callable[..., Awaitable[_T]]
+)
 
 
 class InnerDepends:
@@ -71,20 +72,58 @@ def get_dependency_name(dependency: Dependency[Any]) -> str:
     return dependency.__class__.__name__
 
 
+@lru_cache(maxsize=1024)
+def _get_function_parameters(
+    func: Callable[..., Any],
+) -> tuple[tuple[str, inspect.Parameter, Any], ...]:
+    """获取函数的参数及其类型注解，结果按函数缓存。"""
+    try:
+        type_hints: dict[str, Any] | None = get_type_hints(func)
+    except NameError:
+        type_hints = None
+    return tuple(
+        (
+            name,
+            param,
+            param.annotation if type_hints is None else type_hints.get(name),
+        )
+        for name, param in inspect.signature(func).parameters.items()
+    )
+
+
+def _get_parameters(
+    dependent: Callable[..., Any],
+) -> tuple[tuple[str, inspect.Parameter, Any], ...]:
+    """获取可调用对象的参数及其类型注解。
+
+    绑定方法按其底层函数缓存，以免缓存持有实例。
+    与 `inspect.signature()` 一致，仅当第一个参数可按位置传入时才将其视为绑定的实例，
+    如 `def m(*args, x)` 的 `*args` 会被保留。
+    """
+    if inspect.ismethod(dependent):
+        parameters = _get_function_parameters(dependent.__func__)
+        if parameters and parameters[0][1].kind in (
+            inspect.Parameter.POSITIONAL_ONLY,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        ):
+            return parameters[1:]
+        return parameters
+    try:
+        return _get_function_parameters(dependent)
+    except TypeError:
+        # 不可哈希的可调用对象无法缓存，直接解析
+        return _get_function_parameters.__wrapped__(dependent)
+
+
 async def _execute_callable(
     dependent: Callable[..., Any],
     stack: AsyncExitStack | None,
     dependency_cache: dict[Any, Any],
 ) -> Any:
     """执行可调用对象(函数或 __call__ 方法)，并注入参数。"""
-    func_params = inspect.signature(dependent).parameters
     func_args = {}
 
-    for param_name, param in func_params.items():
-        try:
-            param_type = get_type_hints(dependent).get(param_name)
-        except NameError:
-            param_type = param.annotation
+    for param_name, param, param_type in _get_parameters(dependent):
         if isinstance(param.default, InnerDepends) and param.default.dependency:
             func_args[param_name] = await solve_dependencies(
                 param.default.dependency,
@@ -6,13 +6,12 @@
 
 from abc import ABC, abstractmethod
 from collections.abc import ItemsView, Iterable, Iterator, KeysView, Mapping, ValuesView
-from typing import (  # noqa: UP035
+from typing import (
     Any,
     Generic,
     Literal,
     Self,
     SupportsIndex,
-    Type,
     TypeVar,
     cast,
     overload,
@@ -126,7 +125,11 @@ class Message(ABC, list[MessageSegmentT], Generic[MessageSegmentT]):
         """
         if isinstance(other, str):
             return str(self) == other
-        if isinstance(other, Iterable | MessageSegment | Mapping):
+        # 列表 (包括 Message) 转换为消息时只会原样复制其中的元素，可以直接比较
+        if isinstance(other, list):
+            return super().__eq__(other)
+        # MessageSegment 与 Mapping 均为 Iterable，无需每次构造联合类型
+        if isinstance(other, Iterable):
             return super().__eq__(
                 self.__class__(cast("BuildMessageType[MessageSegmentT]", other))
             )
@@ -207,7 +210,7 @@ class Message(ABC, list[MessageSegmentT], Generic[MessageSegmentT]):
         Returns:
             消息中的纯文本部分。
         """
-        return "".join(map(str, filter(lambda x: x.is_text(), self)))
+        return "".join([str(seg) for seg in self if seg.is_text()])
 
     def filter_message(
         self, include: set[str] | None = None, exclude: set[str] | None = None
@@ -487,7 +490,7 @@ class MessageSegment(ABC, BaseModel, Mapping[str, Any], Generic[MessageT]):
 
     @classmethod
     @abstractmethod
-    def get_message_class(cls) -> Type[MessageT]:  # noqa: UP006
+    def get_message_class(cls) -> type[MessageT]:
         """获取消息类。
 
         Returns:
@@ -545,7 +548,7 @@ class MessageSegment(ABC, BaseModel, Mapping[str, Any], Generic[MessageT]):
         Returns:
             消息字段的哈希值。
         """
-        return hash((self.type, tuple(sorted(self.data.items()))))
+        return hash((self.type, frozenset(self.data.items())))
 
     @override
     def __getitem__(self, key: str) -> Any:
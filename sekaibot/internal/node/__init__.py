@@ -56,6 +56,19 @@ if TYPE_CHECKING:
 _T = TypeVar("_T")
 __all__ = ["Node", "NodeLoadType"]
 
+# 在 rule() 中误用的流程控制异常及其对应的方法名
+_RULE_CONTROL_CALLS: dict[type[Exception], str] = {
+    StopException: "stop()",
+    SkipException: "skip()",
+    JumpToException: "jump_to()",
+    PruningException: "prune()",
+    RejectException: "reject()",
+    FinishException: "finish()",
+}
+_RULE_CONTROL_EXCEPTIONS = tuple(_RULE_CONTROL_CALLS)
+# 运行节点后需交由管理器处理的会话控制异常
+_SESSION_CONTROL_EXCEPTIONS = (PruningException, JumpToException, RejectException)
+
 
 class NodeLoadType(Enum):
     """节点加载类型。"""
@@ -269,8 +282,9 @@ class Node(Generic[EventT, NodeStateT, ConfigT]):
         Raises:
             GetEventTimeout: 超过最大事件数或超时。
         """
+        session_id = self.event.get_session_id()
         return await self.bot.manager.get(
-            lambda e: e.get_session_id() == self.event.get_session_id(),
+            lambda e: e.get_session_id() == session_id,
             event_type=type(self.event),
             adapter_type=type(self.event.adapter), # type: ignore
             max_try_times=max_try_times,
@@ -433,38 +447,26 @@ class Node(Generic[EventT, NodeStateT, ConfigT]):
                 | FinishException
             ],
         ) -> None:
-            mapping_dict = {
-                StopException: "stop()",
-                SkipException: "skip()",
-                JumpToException: "jump_to()",
-                PruningException: "prune()",
-                RejectException: "reject()",
-                FinishException: "finish()",
-            }
             for exc in flatten_exception_group(exc_group):
-                with suppress(StopIteration):
+                # 先按精确类型查表，子类异常再回退到 isinstance 匹配
+                exc_log = _RULE_CONTROL_CALLS.get(type(exc))
+                if exc_log is None:
                     exc_log = next(
-                        _log
-                        for _exc, _log in mapping_dict.items()
-                        if isinstance(exc, _exc)
+                        (
+                            _log
+                            for _exc, _log in _RULE_CONTROL_CALLS.items()
+                            if isinstance(exc, _exc)
+                        ),
+                        None,
                     )
+                if exc_log is not None:
                     logger.warning(
-                        f"You should not use `{exc_log}` in `rule()`, please instead use in node",
+                        "You should not use `%s` in `rule()`, please instead use in node",
+                        exc_log,
                         node=self.__class__,
                     )
 
-        with catch(
-            {
-                (
-                    StopException,
-                    SkipException,
-                    JumpToException,
-                    PruningException,
-                    RejectException,
-                    FinishException,
-                ): _handle_special_exception
-            }
-        ):
+        with catch({_RULE_CONTROL_EXCEPTIONS: _handle_special_exception}):
             return await self.rule()
         return False
 
@@ -563,22 +565,12 @@ class Node(Generic[EventT, NodeStateT, ConfigT]):
                     None,
                 )
                 exc = reject or jumpto_exc or pruning_exc
-            elif isinstance(
-                excs[0], PruningException | JumpToException | RejectException
-            ):
+            elif isinstance(excs[0], _SESSION_CONTROL_EXCEPTIONS):
                 exc = excs[0]
 
         rule_failed = True
 
-        with catch(
-            {
-                (
-                    PruningException,
-                    JumpToException,
-                    RejectException,
-                ): _handle_special_exception
-            }
-        ):
+        with catch({_SESSION_CONTROL_EXCEPTIONS: _handle_special_exception}):
             if await self._run_rule():
                 logger.info("Event will be handled by node", node=self.__class__)
                 rule_failed = False
@@ -650,20 +642,20 @@ class Node(Generic[EventT, NodeStateT, ConfigT]):
         self, *dependencies: Dependency[Any], return_exceptions: bool = False
     ) -> tuple[Any, ...]:
         """类似 `asyncio.gather()` 并发执行多个任务，支持 `return_exceptions`"""
-        results: dict[Any, Any] = {}
+        # 按下标写回结果，重复或不可哈希的依赖也能一一对应
+        results: list[Any] = [None] * len(dependencies)
 
-        async def wrapper(dep: Dependency[Any]) -> None:
-            nonlocal results
+        async def wrapper(index: int, dep: Dependency[Any]) -> None:
             try:
-                results[dep] = await self.run(dep)
+                results[index] = await self.run(dep)
             except Exception as e:
                 if return_exceptions:
-                    results[dep] = e
+                    results[index] = e
                 else:
                     raise
 
         async with anyio.create_task_group() as tg:
-            for dependency in dependencies:
-                tg.start_soon(wrapper, dependency)
+            for index, dependency in enumerate(dependencies):
+                tg.start_soon(wrapper, index, dependency)
 
-        return tuple(results[dep] for dep in dependencies)
+        return tuple(results)
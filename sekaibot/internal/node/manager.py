@@ -1,6 +1,5 @@
 """SekaiBot 事件分配类"""
 
-import time
 from collections.abc import Awaitable, Callable
 from contextlib import AsyncExitStack
 from functools import partial
@@ -43,6 +42,7 @@ class NodeManager:
 
     _condition: anyio.Condition
     _current_event: Event[Adapter[Any, Any]] | None
+    _getter_count: int = 0
 
     _event_send_stream: MemoryObjectSendStream[EventHandleOption]  # pyright: ignore[reportUninitializedInstanceVariable]
     _event_receive_stream: MemoryObjectReceiveStream[EventHandleOption]  # pyright: ignore[reportUninitializedInstanceVariable]
@@ -292,7 +292,8 @@ class NodeManager:
     async def _handle_event_receive(self) -> None:
         async with anyio.create_task_group() as tg, self._event_receive_stream:
             async for current_event, handle_get in self._event_receive_stream:
-                if handle_get:
+                # 没有 get 方法在等待事件时，无需经过条件变量，直接分发
+                if handle_get and self._getter_count:
                     await tg.start(self._handle_event_wait_condition)
                     async with self._condition:
                         self._current_event = current_event
@@ -331,10 +332,13 @@ class NodeManager:
         async def temporary_task(
             func: Callable[[Event[Any]], bool | Awaitable[bool]] | None = None,
         ) -> None:
+            session_id = current_event.get_session_id()
+            get_func = wrap_get_func(func)
+
             async def check(event: Event[Any]) -> bool:
-                if event.get_session_id() != current_event.get_session_id():
+                if event.get_session_id() != session_id:
                     return False
-                return await wrap_get_func(func)(event)
+                return await get_func(event)
 
             try:
                 event = await self.get(
@@ -487,6 +491,15 @@ class NodeManager:
         if current_event.__handled__:
             return
 
+        if (
+            not self.bot.nodes_list
+            and not self.bot._event_preprocessor_hooks
+            and not self.bot._event_postprocessor_hooks
+        ):
+            # 没有任何节点与事件钩子时无需建立上下文栈和依赖缓存
+            logger.debug("No nodes or event hooks to handle event")
+            return
+
         async with AsyncExitStack() as stack:
             dependency_cache: dict[Any, Any] = {}
             state = state or {}
@@ -498,10 +511,9 @@ class NodeManager:
             ):
                 return
 
-            nodes_list = self.bot.nodes_list.copy()
-            jump_to_index_map = {
-                node.__name__: i for i, (node, _) in enumerate(nodes_list)
-            }
+            # nodes_list 只会被整体替换，直接持有当前列表及其下标映射即可
+            jump_to_index_map = self.bot.nodes_index
+            nodes_list = self.bot.nodes_list
             index = jump_to_index_map.get(start_class.__name__, 0) if start_class else 0
             interrupted = False
 
@@ -643,30 +655,35 @@ class NodeManager:
         """
         _func = wrap_get_func(func, event_type=event_type, adapter_type=adapter_type)
 
-        try_times = 0
-        start_time = time.time()
-        while not self.bot._should_exit.is_set():
-            if max_try_times is not None and try_times > max_try_times:
-                break
-            if time.time() - start_time > timeout:
-                break
-
-            async with self._condition:
-                try:
-                    with anyio.fail_after(start_time + timeout - time.time()):
-                        await self._condition.wait()
-                except TimeoutError:
+        self._getter_count += 1
+        try:
+            try_times = 0
+            deadline = anyio.current_time() + timeout
+            while not self.bot._should_exit.is_set():
+                if max_try_times is not None and try_times > max_try_times:
+                    break
+                remaining = deadline - anyio.current_time()
+                if remaining < 0:
                     break
 
-                if (
-                    self._current_event is not None
-                    and not self._current_event.__handled__
-                    and await _func(self._current_event)
-                ):
-                    self._current_event.__handled__ = True
-                    logger.debug("Event caught", current_event=self._current_event)
-                    return self._current_event
-
-                try_times += 1
-
-        raise GetEventTimeout
+                async with self._condition:
+                    try:
+                        with anyio.fail_after(remaining):
+                            await self._condition.wait()
+                    except TimeoutError:
+                        break
+
+                    if (
+                        self._current_event is not None
+                        and not self._current_event.__handled__
+                        and await _func(self._current_event)
+                    ):
+                        self._current_event.__handled__ = True
+                        logger.debug("Event caught", current_event=self._current_event)
+                        return self._current_event
+
+                    try_times += 1
+
+            raise GetEventTimeout
+        finally:
+            self._getter_count -= 1
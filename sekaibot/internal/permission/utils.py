@@ -11,6 +11,8 @@ FrontMatter:
     description: nonebot.permission 模块
 """
 
+import re
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Self
 from typing_extensions import override
 
@@ -32,11 +34,15 @@ class UserPermission:
         perm: 要求用户需同时满足的权限
     """
 
-    __slots__ = ("perm", "users")
+    __slots__ = ("_pattern", "perm", "users")
 
     def __init__(self, users: tuple[str, ...], perm: Permission | None = None) -> None:
         self.users = users
         self.perm = perm
+        # 多个会话 ID 时预编译为一个多选正则，只需扫描一次会话 ID
+        self._pattern = (
+            re.compile("|".join(map(re.escape, users))) if len(users) > 1 else None
+        )
 
     @override
     def __repr__(self) -> str:
@@ -52,6 +58,8 @@ class UserPermission:
             session = event.get_session_id()
         except Exception:
             return False
+        if self._pattern is not None:
+            return self._pattern.search(session) is not None
         return any(user in session for user in self.users)
 
     @classmethod
@@ -89,6 +97,12 @@ class UserPermission:
         return cls(users, perm=perm and cls._clean_permission(perm))
 
 
+@lru_cache(maxsize=64)
+def _get_adapter_prefix(adapter_name: str) -> str:
+    """获取适配器在超级用户配置中使用的前缀，同一适配器名称只计算一次。"""
+    return adapter_name.split(maxsplit=1)[0].lower()
+
+
 class SuperUserPermission:
     """检查当前事件是否是消息事件且属于超级管理员"""
 
@@ -100,29 +114,23 @@ class SuperUserPermission:
 
     async def __call__(self, bot: "Bot", event: Event[Any]) -> bool:
         """运行超级用户检测"""
+        superusers = bot.config.permission.superusers
+        if not superusers:
+            return False
         try:
             user_id = event.get_user_id()
-            group_id = (
-                "group_" + str(getattr(event, "group_id", "no_group_id"))
-            )
+            group_id = f"group_{getattr(event, 'group_id', 'no_group_id')}"
         except Exception:
             return False
 
-        adapter_name = event.adapter.name.split(maxsplit=1)[0].lower()
-        superusers = bot.config.permission.superusers
+        adapter_name = _get_adapter_prefix(event.adapter.name)
         return (
             f"{adapter_name}:{user_id}" in superusers
             or user_id in superusers  # 兼容旧配置
-            or (
-                (
-                    f"{adapter_name}:{group_id}" in superusers
-                    or group_id in superusers  # 兼容旧配置
-                    or f"{adapter_name}:{group_id}_{user_id}" in superusers
-                    or f"{group_id}_{user_id}" in superusers  # 兼容旧配置
-                )
-                if group_id
-                else False
-            )
+            or f"{adapter_name}:{group_id}" in superusers
+            or group_id in superusers  # 兼容旧配置
+            or f"{adapter_name}:{group_id}_{user_id}" in superusers
+            or f"{group_id}_{user_id}" in superusers  # 兼容旧配置
         )
 
 
@@ -5,16 +5,19 @@
 
 import json
 import time as time_util
+from bisect import bisect_right
 from collections import deque
 from collections.abc import Callable, Iterator
 from dataclasses import asdict, dataclass
+from heapq import merge
+from itertools import islice
 from typing import Any, Generic, Self, TypeVar
 from typing_extensions import override
 
 _T = TypeVar("_T")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RecordedEvent(Generic[_T]):
     """表示记录的事件及其属性。"""
 
@@ -23,6 +26,11 @@ class RecordedEvent(Generic[_T]):
     timestamp: float
 
 
+def _get_timestamp(event: RecordedEvent[Any]) -> float:
+    """获取记录事件的时间戳。"""
+    return event.timestamp
+
+
 class Counter(Generic[_T]):
     """简单易用的事件计数器：支持时间窗口、数量窗口命中分析及合并、导出、还原等功能。"""
 
@@ -56,15 +64,17 @@ class Counter(Generic[_T]):
         """
         ts = timestamp if timestamp is not None else self._time()
         new_event = RecordedEvent(event, matched, ts)
+        events = self._events
 
-        # 快速 append
-        self._events.append(new_event)
+        # 时间有序时直接 append
+        if not events or events[-1].timestamp <= ts:
+            events.append(new_event)
+            return
 
-        # 如果破坏了时间顺序，仅在必要时排序修复
-        if len(self._events) > 1 and self._events[-2].timestamp > ts:
-            self._events = deque(
-                sorted(self._events, key=lambda e: e.timestamp), maxlen=self._max_size
-            )
+        # 乱序事件二分插入到对应位置，与 append 一样在已满时丢弃最早的事件
+        if len(events) == events.maxlen:
+            events.popleft()
+        events.insert(bisect_right(events, ts, key=_get_timestamp), new_event)
 
     async def arecord(
         self, event: _T, matched: bool = False, timestamp: float | None = None
@@ -110,7 +120,12 @@ class Counter(Generic[_T]):
         Returns:
             命中事件数量。
         """
-        return sum(1 for e in list(self._events)[-n:] if e.matched)
+        return sum(1 for e in self._iter_latest(n) if e.matched)
+
+    def _iter_latest(self, n: int) -> Iterator[RecordedEvent[_T]]:
+        """不复制整个队列，迭代与 `list(events)[-n:]` 相同的记录。"""
+        start = max(len(self._events) - n, 0) if n > 0 else -n
+        return islice(self._events, start, None)
 
     def count_matched(self) -> int:
         """获取命中事件总数。
@@ -163,7 +178,7 @@ class Counter(Generic[_T]):
         Returns:
             事件迭代器。
         """
-        return (e.event for e in list(self._events)[-n:] if e.matched)
+        return (e.event for e in self._iter_latest(n) if e.matched)
 
     def iter_matched(self) -> Iterator[_T]:
         """迭代所有命中事件。
@@ -252,9 +267,8 @@ class Counter(Generic[_T]):
             新的合并后的 EventCounter。
         """
         merged = Counter[_T](max_size=self._max_size, time_func=self._time)
-        merged._events.extend(
-            sorted(list(self._events) + list(other._events), key=lambda e: e.timestamp)
-        )
+        # 两个计数器中的事件均已按时间戳有序，线性归并即可
+        merged._events.extend(merge(self._events, other._events, key=_get_timestamp))
         return merged
 
     def __iadd__(self, other: "Counter[_T]") -> Self:
@@ -266,8 +280,8 @@ class Counter(Generic[_T]):
         Returns:
             自身。
         """
-        self._events.extend(other._events)
         self._events = deque(
-            sorted(self._events, key=lambda e: e.timestamp), maxlen=self._max_size
+            merge(self._events, other._events, key=_get_timestamp),
+            maxlen=self._max_size,
         )
         return self
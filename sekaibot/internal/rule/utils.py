@@ -15,8 +15,14 @@ import re
 import shlex
 from argparse import Action, ArgumentError, Namespace
 from argparse import ArgumentParser as ArgParser
-from collections.abc import Hashable, Sequence  # pylint: disable=unused-import
+from collections.abc import (  # pylint: disable=unused-import
+    Callable,
+    Hashable,
+    Iterable,
+    Sequence,
+)
 from contextvars import ContextVar
+from functools import lru_cache
 from gettext import gettext
 from itertools import chain, product
 from pathlib import Path
@@ -33,8 +39,6 @@ from typing import (
 )
 from typing_extensions import override
 
-from pygtrie import CharTrie  # type: ignore
-
 from sekaibot.consts import (
     BOT_GLOBAL_KEY,
     CMD_ARG_KEY,
@@ -228,7 +232,6 @@ class FullmatchRule:
         """检查消息纯文本是否与指定字符串全匹配。"""
         try:
             text = event.get_plain_text()
-            message = event.get_message()
         except Exception:
             return False
         if not text:
@@ -238,6 +241,11 @@ class FullmatchRule:
         if text in self.msgs:
             state[FULLMATCH_KEY] = text
             return True
+        # 纯文本未命中时才需要获取完整消息
+        try:
+            message = event.get_message()
+        except Exception:
+            return False
         if message in self.msgs:
             state[FULLMATCH_KEY] = message
             return True
@@ -251,7 +259,7 @@ class KeywordsRule:
         keywords: 指定关键字集合
     """
 
-    __slots__ = ("ignorecase", "keywords")
+    __slots__ = ("_has_empty", "_match_words", "ignorecase", "keywords")
 
     def __init__(
         self, keywords: tuple[str | MessageSegment[Any], ...], ignorecase: bool = False
@@ -261,6 +269,35 @@ class KeywordsRule:
             for keyword in keywords
         }
         self.ignorecase = ignorecase
+        # 空字符串关键字总是包含于非空文本中，匹配器不处理它，需单独记录
+        self._has_empty = "" in self.keywords
+        self._match_words = self._build_matcher()
+
+    def _build_matcher(self) -> Callable[[str], Iterable[str]]:
+        """根据字符串关键字的数量预先选择匹配方式。
+
+        没有关键字时直接返回空结果，只有一个关键字时使用子串查找，
+        多个关键字时预编译为 Aho-Corasick 自动机，只需扫描一次文本。
+        """
+        words = [k for k in self.keywords if isinstance(k, str) and k]
+        if not words:
+            return lambda _: ()
+        if len(words) == 1:
+            word = words[0]
+            return lambda text: (word,) if word in text else ()
+
+        try:
+            from ahocorasick import Automaton  # type: ignore
+        except ImportError:
+            raise ImportError(
+                "pyahocorasick is not installed, please install it first."
+            ) from None
+
+        automaton = cast("Any", Automaton())
+        for word in words:
+            automaton.add_word(word, word)
+        automaton.make_automaton()
+        return lambda text: (word for _, word in automaton.iter(text))
 
     @override
     def __repr__(self) -> str:
@@ -280,24 +317,48 @@ class KeywordsRule:
 
     async def __call__(self, event: Event[Any], state: StateT) -> bool:
         """检查消息纯文本是否包含指定关键字。"""
+        if not self.keywords:
+            return False
         try:
             text = event.get_plain_text()
-            message = event.get_message()
         except Exception:
             return False
         if not text:
             return False
         text = text.casefold() if self.ignorecase else text
-        if keys := tuple(
-            k
-            for k in self.keywords
-            if (isinstance(k, str) and (k in text)) or k in message
-        ):
+
+        matched: set[str | MessageSegment[Any]] = set(self._match_words(text))
+        if self._has_empty:
+            matched.add("")
+
+        # 纯文本已命中全部关键字时，无需再获取并渲染完整消息
+        if not self.keywords <= matched:
+            try:
+                message = event.get_message()
+            except Exception:
+                return False
+            matched.update(self._match_words(str(message)))
+            matched.update(
+                k for k in self.keywords if not isinstance(k, str) and k in message
+            )
+
+        if keys := tuple(k for k in self.keywords if k in matched):
             state[KEYWORD_KEY] = keys
             return True
         return False
 
 
+@lru_cache(maxsize=1024)
+def _pinyin_initials(text: str) -> str:
+    """获取文本的拼音首字母，同一文本只转换一次。
+
+    调用前需确保已安装 `pypinyin`。
+    """
+    from pypinyin import Style, lazy_pinyin
+
+    return "".join(lazy_pinyin(text, style=Style.FIRST_LETTER))
+
+
 class WordFilterRule:
     """检查消息纯文本是否包含指定关键字，用于敏感词过滤。
 
@@ -309,7 +370,14 @@ class WordFilterRule:
         use_aho: 是否启用 Aho-Corasick 算法 (当词数较大时自动激活) ，使用 `pyahocorasick` 库
     """
 
-    __slots__ = ("_automaton", "ignorecase", "use_aho", "use_pinyin", "words")
+    __slots__ = (
+        "_automaton",
+        "_pattern",
+        "ignorecase",
+        "use_aho",
+        "use_pinyin",
+        "words",
+    )
 
     def __init__(
         self,
@@ -323,6 +391,7 @@ class WordFilterRule:
         self.words: set[str] = set()
         self.use_aho = use_aho
         self._automaton = None
+        self._pattern: re.Pattern[str] | None = None
 
         if word_file:
             self._load_word_set(word_file)
@@ -336,16 +405,16 @@ class WordFilterRule:
 
         if self.use_pinyin:
             try:
-                from pypinyin import Style, lazy_pinyin
+                import pypinyin  # noqa: F401  # pyright: ignore[reportUnusedImport]
             except ImportError:
                 raise ImportError(
                     "pypinyin is not installed, please install it first."
                 ) from None
 
             self.words = {
-                "".join(lazy_pinyin(word, style=Style.FIRST_LETTER)).casefold()
+                _pinyin_initials(word).casefold()
                 if ignorecase
-                else "".join(lazy_pinyin(word, style=Style.FIRST_LETTER))
+                else _pinyin_initials(word)
                 for word in self.words
             }
 
@@ -362,6 +431,11 @@ class WordFilterRule:
                 raise ImportError(
                     "pyahocorasick is not installed, please install it first."
                 ) from None
+        elif self.words:
+            # 未启用自动机时将全部敏感词预编译为一个多选正则，只需扫描一次文本
+            self._pattern = re.compile(
+                "|".join(map(re.escape, sorted(self.words, key=len, reverse=True)))
+            )
 
     @override
     def __repr__(self) -> str:
@@ -392,6 +466,8 @@ class WordFilterRule:
         Return:
             bool: 如果消息合法 (不包含敏感词) 返回 True，否则 False
         """
+        if not self.words:
+            return True
         try:
             text = event.get_plain_text()
         except Exception:
@@ -402,19 +478,16 @@ class WordFilterRule:
         text = text.casefold() if self.ignorecase else text
 
         if self.use_pinyin:
-            try:
-                from pypinyin import Style, lazy_pinyin
-            except ImportError:
-                raise ImportError(
-                    "pypinyin is not installed, please install it first."
-                ) from None
+            text += _pinyin_initials(text)
 
-            text += "".join(lazy_pinyin(text, style=Style.FIRST_LETTER))
+        if self._automaton is not None:
+            # 命中第一个敏感词即可返回，无需继续扫描与解包
+            return next(self._automaton.iter(text), None) is None  # type: ignore
 
-        if self._automaton:
-            return not any(True for _, (_, word) in self._automaton.iter(text))  # type: ignore
+        if self._pattern is not None:
+            return self._pattern.search(text) is None
 
-        return not any(word in text for word in self.words)
+        return True
 
     def _load_word_set(self, file_path: Path) -> None:
         """从 txt 文件加载敏感词，每行一个词。
@@ -449,11 +522,12 @@ class RegexRule:
         flags: 正则表达式标记
     """
 
-    __slots__ = ("flags", "regex")
+    __slots__ = ("_pattern", "flags", "regex")
 
     def __init__(self, regex: str, flags: int = 0) -> None:
         self.regex = regex
         self.flags = flags
+        self._pattern = re.compile(regex, flags)
 
     @override
     def __repr__(self) -> str:
@@ -477,7 +551,7 @@ class RegexRule:
             msg = event.get_message()
         except Exception:
             return False
-        if matched := re.search(self.regex, str(msg), self.flags):
+        if matched := self._pattern.search(str(msg)):
             state[REGEX_MATCHED] = matched
             return True
         return False
@@ -535,14 +609,17 @@ class CountTriggerRule:
         global_state: GlobalStateT,
     ) -> bool:
         """计数器规则。"""
-        if isinstance(global_state[BOT_GLOBAL_KEY][COUNTER_STATE], dict):
-            counter: Counter[Event[Any]] = global_state[BOT_GLOBAL_KEY][
-                COUNTER_STATE
-            ].setdefault(name, Counter[Event[Any]](self.max_size))
-        else:
-            counter = Counter[Event[Any]](self.max_size)
-            global_state[BOT_GLOBAL_KEY][COUNTER_STATE] = {name: counter}
-
+        bot_state = global_state[BOT_GLOBAL_KEY]
+        counters = bot_state.get(COUNTER_STATE)
+        if not isinstance(counters, dict):
+            counters = bot_state[COUNTER_STATE] = {}
+        # 仅在计数器不存在时才创建，避免 setdefault 每次都构造新的计数器
+        counter: Counter[Event[Any]] | None = counters.get(name)
+        if counter is None:
+            counter = counters[name] = Counter[Event[Any]](self.max_size)
+
+        # 适配器已将事件时间校验为数值类型，此处仅读取一次
+        timestamp: float | None = getattr(event, "time", None)
         if self.rule:
             counter.record(
                 event,
@@ -552,18 +629,16 @@ class CountTriggerRule:
                     state=state,
                     global_state=global_state,
                 ),
-                getattr(event, "time", None),
+                timestamp,
             )
         else:
-            counter.record(event, True, getattr(event, "time", None))
+            counter.record(event, True, timestamp)
 
         trigger = False
         if (
             self.time_window
             and len(
-                time_trigger := tuple(
-                    counter.iter_in_time(self.time_window, getattr(event, "time", None))
-                )
+                time_trigger := tuple(counter.iter_in_time(self.time_window, timestamp))
             )
             >= self.min_trigger
         ):
@@ -585,12 +660,51 @@ class TrieRule:
     prefix: Any
 
     def __init__(self) -> None:
+        # pygtrie 仅在构造命令类规则时才需要，延迟导入以加快模块导入
+        from pygtrie import CharTrie  # type: ignore
+
         self.prefix: Any = cast("Any", CharTrie())
+        self._prefix_config: tuple[frozenset[str], frozenset[str]] | None = None
+
+    def set_commands(
+        self,
+        cmds: Iterable[str | tuple[str, ...]],
+        command_start: Iterable[str],
+        command_sep: Iterable[str],
+    ) -> None:
+        """根据命令起始符和分隔符添加命令前缀。
+
+        命令前缀只取决于配置，配置未变时 (如重启) 不会重复构建。
+
+        Args:
+            cmds: 命令元组列表。
+            command_start: 命令起始符。
+            command_sep: 命令分隔符。
+        """
+        prefix_config = (frozenset(command_start), frozenset(command_sep))
+        if prefix_config == self._prefix_config:
+            return
+        if self._prefix_config is not None:
+            self.prefix.clear()
+        self._prefix_config = prefix_config
+
+        for command in cmds:
+            if isinstance(command, str):
+                command = (command,)
+
+            if len(command) == 1:
+                for start in command_start:
+                    self.add_prefix(f"{start}{command[0]}", TrieValue(start, command))
+            else:
+                for start, sep in product(command_start, command_sep):
+                    self.add_prefix(
+                        f"{start}{sep.join(command)}", TrieValue(start, command)
+                    )
 
     def add_prefix(self, prefix: str, value: TrieValue) -> None:
         """添加 prefix"""
         if prefix in self.prefix:
-            logger.warning(f'Duplicated prefix rule "{prefix}"')
+            logger.warning('Duplicated prefix rule "%s"', prefix)
             return
         self.prefix[prefix] = value
 
@@ -669,26 +783,9 @@ class CommandRule:
         Bot.bot_startup_hook(self._set_prefix)
 
     def _set_prefix(self, bot: "Bot") -> None:
-        command_start = bot.config.rule.command_start
-        command_sep = bot.config.rule.command_sep
-
-        commands: list[tuple[str, ...]] = []
-        for command in self.cmds:
-            if isinstance(command, str):
-                command = (command,)
-
-            commands.append(command)
-
-            if len(command) == 1:
-                for start in command_start:
-                    self.char_trie.add_prefix(
-                        f"{start}{command[0]}", TrieValue(start, command)
-                    )
-            else:
-                for start, sep in product(command_start, command_sep):
-                    self.char_trie.add_prefix(
-                        f"{start}{sep.join(command)}", TrieValue(start, command)
-                    )
+        self.char_trie.set_commands(
+            self.cmds, bot.config.rule.command_start, bot.config.rule.command_sep
+        )
 
     @override
     def __repr__(self) -> str:
@@ -835,25 +932,9 @@ class ShellCommandRule:
         Bot.bot_startup_hook(self._set_prefix)
 
     def _set_prefix(self, bot: "Bot") -> None:
-        command_start = bot.config.rule.command_start
-        command_sep = bot.config.rule.command_sep
-        commands: list[tuple[str, ...]] = []
-        for command in self.cmds:
-            if isinstance(command, str):
-                command = (command,)
-
-            commands.append(command)
-
-            if len(command) == 1:
-                for start in command_start:
-                    self.char_trie.add_prefix(
-                        f"{start}{command[0]}", TrieValue(start, command)
-                    )
-            else:
-                for start, sep in product(command_start, command_sep):
-                    self.char_trie.add_prefix(
-                        f"{start}{sep.join(command)}", TrieValue(start, command)
-                    )
+        self.char_trie.set_commands(
+            self.cmds, bot.config.rule.command_start, bot.config.rule.command_sep
+        )
 
     @override
     def __repr__(self) -> str:
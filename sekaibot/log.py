@@ -54,11 +54,19 @@ default_format = structlog.dev.ConsoleRenderer(colors=True)
 class StructLogHandler(logging.Handler):
     """Python `logging` 日志 to `structlog` 适配器，将 `logging` 事件转发到 `structlog`。"""
 
+    def __init__(self, level: int | str = logging.NOTSET) -> None:
+        super().__init__(level)
+        # 每个 logging 名称复用同一个 structlog 代理对象
+        self._loggers: dict[str, FilteringBoundLogger] = {}
+
     @override
     def emit(self, record: logging.LogRecord) -> None:
-        structlog.get_logger(record.name).bind(exc_info=record.exc_info).log(
-            record.levelno, record.getMessage()
-        )
+        struct_logger = self._loggers.get(record.name)
+        if struct_logger is None:
+            struct_logger = self._loggers[record.name] = structlog.get_logger(
+                record.name
+            )
+        struct_logger.log(record.levelno, record.getMessage(), exc_info=record.exc_info)
 
 
 logger: "FilteringBoundLogger" = structlog.get_logger("nonebot")
@@ -18,7 +18,7 @@ from collections.abc import (
 )
 from contextlib import AbstractContextManager as ContextManager
 from contextlib import asynccontextmanager
-from functools import partial
+from functools import lru_cache, partial
 from importlib.abc import MetaPathFinder
 from importlib.machinery import ModuleSpec, PathFinder
 from inspect import get_annotations
@@ -76,7 +76,7 @@ _E = TypeVar("_E", bound=BaseException)
 _TypeT = TypeVar("_TypeT", bound=type[Any])
 _BaseModelT = TypeVar("_BaseModelT", bound=BaseModel)
 
-StrOrBytesPath = Union[str, bytes, os.PathLike[Any]]  # type alias  # noqa: UP007
+StrOrBytesPath = str | bytes | os.PathLike[Any]  # type alias
 TreeType = dict[_T, Union[Any, "TreeType[_T]"]]
 
 
@@ -107,9 +107,17 @@ def is_config_class(config_class: Any) -> TypeGuard[type[ConfigModel]]:
     Returns:
         返回是否是配置类。
     """
+    return inspect.isclass(config_class) and _is_config_class(config_class)
+
+
+@lru_cache(maxsize=1024)
+def _is_config_class(config_class: type[Any]) -> bool:
+    """判断一个类是否是配置类，结果按类缓存。
+
+    `config` 属性每次访问都会进行此判断，缓存后无需重复检查类结构。
+    """
     return (
-        inspect.isclass(config_class)
-        and issubclass(config_class, ConfigModel)
+        issubclass(config_class, ConfigModel)
         and isinstance(getattr(config_class, "__config_name__", None), str)
         and ABC not in config_class.__bases__
         and not inspect.isabstract(config_class)
@@ -151,17 +159,15 @@ def get_classes_from_module(module: ModuleType, super_class: _TypeT) -> list[_Ty
     Returns:
         返回符合条件的类的列表。
     """
-    classes: list[_TypeT] = []
-    for _, module_attr in inspect.getmembers(module, inspect.isclass):
-        if (
-            (inspect.getmodule(module_attr) or module) is module
-            and issubclass(module_attr, super_class)
-            and module_attr != super_class
-            and ABC not in module_attr.__bases__
-            and not inspect.isabstract(module_attr)
-        ):
-            classes.append(cast("_TypeT", module_attr))
-    return classes
+    return [
+        cast("_TypeT", module_attr)
+        for _, module_attr in inspect.getmembers(module, inspect.isclass)
+        if issubclass(module_attr, super_class)
+        and module_attr != super_class
+        and (inspect.getmodule(module_attr) or module) is module
+        and ABC not in module_attr.__bases__
+        and not inspect.isabstract(module_attr)
+    ]
 
 
 def get_classes_from_module_name(
@@ -228,29 +234,32 @@ def flatten_tree_with_jumps(tree: TreeType[_T]) -> list[tuple[_T, int]]:
     def build_jump_map() -> dict[_T, int]:
         """构建剪枝跳转映射，计算每个节点剪枝后的跳转索引"""
         jump_map: dict[_T, int] = dict.fromkeys(ordered_nodes, -1)  # 默认剪枝后都终止
-
-        for i in range(len(ordered_nodes) - 1, -1, -1):
-            node: _T = ordered_nodes[i]
+        # 预先计算节点在遍历顺序与兄弟节点中的位置，避免反复线性查找
+        order_index: dict[_T, int] = {node: i for i, node in enumerate(ordered_nodes)}
+        sibling_index: dict[_T, int] = {
+            node: pos
+            for siblings in children_map.values()
+            for pos, node in enumerate(siblings)
+        }
+
+        for node in reversed(ordered_nodes):
             parent: _T | None = parent_map.get(node)
 
             siblings: list[_T] = children_map.get(parent, [])
-            node_pos: int = siblings.index(node)
+            node_pos: int = sibling_index[node]
 
             if node_pos + 1 < len(siblings):
-                jump_map[node] = ordered_nodes.index(siblings[node_pos + 1])
+                jump_map[node] = order_index[siblings[node_pos + 1]]
             else:
                 temp_parent: _T | None = parent
                 while temp_parent is not None:
                     parent_siblings: list[_T] = children_map.get(
                         parent_map.get(temp_parent), []
                     )
-                    if temp_parent in parent_siblings:
-                        temp_pos: int = parent_siblings.index(temp_parent)
-                        if temp_pos + 1 < len(parent_siblings):
-                            jump_map[node] = ordered_nodes.index(
-                                parent_siblings[temp_pos + 1]
-                            )
-                            break
+                    temp_pos: int = sibling_index[temp_parent]
+                    if temp_pos + 1 < len(parent_siblings):
+                        jump_map[node] = order_index[parent_siblings[temp_pos + 1]]
+                        break
                     temp_parent = parent_map.get(temp_parent)
 
         return jump_map
@@ -277,12 +286,16 @@ def handle_exception(
     **kwargs: Any,
 ) -> Callable[[BaseExceptionGroup[Exception]], None]:
     """递归遍历 BaseExceptionGroup ，并输出日志"""
+    with_exc_info = level in ("error", "critical")
+
     def _handle(exc_group: BaseExceptionGroup[Exception]) -> None:
+        # 日志方法在实际发生异常时才解析，且每个异常组只解析一次
+        log = getattr(logger, level)
         for exc in flatten_exception_group(exc_group):
-            if level in ("error", "critical"):
-                getattr(logger, level)(msg, exc_info=exc, **kwargs)
+            if with_exc_info:
+                log(msg, exc_info=exc, **kwargs)
             else:
-                getattr(logger, level)(msg, **kwargs)
+                log(msg, **kwargs)
 
     return _handle
 
@@ -418,18 +431,30 @@ def wrap_get_func(
     Returns:
         异步函数。
     """
-    if func is None:
-        func = sync_func_wrapper(lambda _: True)
-    elif not inspect.iscoroutinefunction(func):
-        func = sync_func_wrapper(cast("Callable[[EventT], bool]", func))
-
-    async def _func(event: EventT) -> bool:
-        return (
-            (event_type is None or isinstance(event, event_type))
-            and (adapter_type is None or isinstance(event.adapter, adapter_type))
-            and await func(event)
+
+    def _check_type(event: EventT) -> bool:
+        return (event_type is None or isinstance(event, event_type)) and (
+            adapter_type is None or isinstance(event.adapter, adapter_type)
         )
 
+    if func is None:
+
+        async def _func(event: EventT) -> bool:
+            return _check_type(event)
+
+    elif inspect.iscoroutinefunction(func):
+        async_func = func
+
+        async def _func(event: EventT) -> bool:
+            return _check_type(event) and await async_func(event)
+
+    else:
+        # 同步函数直接调用，无需再包装一层协程
+        sync_func = cast("Callable[[EventT], bool]", func)
+
+        async def _func(event: EventT) -> bool:
+            return _check_type(event) and sync_func(event)
+
     return _func
 
 
@@ -1,3 +1,4 @@
+import inspect
 from collections.abc import AsyncGenerator, Generator
 from contextlib import AsyncExitStack
 from types import TracebackType
@@ -453,3 +454,51 @@ async def test_dependency_cache_behavior(mocker: MockerFixture) -> None:
     assert obj is not None
     assert obj.b.a is obj.a  # 验证缓存实例被复用
     assert mock.call_args_list == [mocker.call("a_created"), mocker.call("b_created")]
+
+
+@pytest.mark.anyio
+async def test_bound_method_dependency(mocker: MockerFixture) -> None:
+    mock = mocker.MagicMock()
+
+    class DepA: ...
+
+    class CreateB:
+        async def __call__(self, a: DepA) -> DepA:
+            mock("b_created", self, a)
+            return a
+
+    create_b = CreateB()
+
+    class Dependent:
+        a = Depends(DepA)
+        b = Depends(create_b)
+
+    obj = None
+
+    async with AsyncExitStack() as stack:
+        obj = await solve_dependencies(
+            Dependent,
+            use_cache=True,
+            stack=stack,
+            dependency_cache={},
+        )
+
+    assert obj is not None
+    assert obj.b is obj.a
+    mock.assert_called_once_with("b_created", create_b, obj.a)
+
+
+def test_bound_method_parameters() -> None:
+    from sekaibot.dependencies.utils import _get_parameters
+
+    class DepA: ...
+
+    class Dependent:
+        def method(self, a: DepA) -> None: ...
+
+        def var_args(*args: object, a: DepA) -> None: ...
+
+    for method in (Dependent().method, Dependent().var_args):
+        assert [(name, param) for name, param, _ in _get_parameters(method)] == list(
+            inspect.signature(method).parameters.items()
+        )
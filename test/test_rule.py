@@ -1,7 +1,8 @@
 import pytest
 
-from sekaibot.consts import ENDSWITH_KEY, STARTSWITH_KEY
+from sekaibot.consts import ENDSWITH_KEY, KEYWORD_KEY, STARTSWITH_KEY
 from sekaibot.internal.message import Message, MessageSegment
+from sekaibot.internal.rule.utils import KeywordsRule
 from sekaibot.rule import (
     EndsWith,
     StartsWith,
@@ -75,6 +76,38 @@ async def test_startswith_endswith():
     assert ENDSWITH_KEY not in state
 
 
+@pytest.mark.anyio
+async def test_keywords_rule():
+    event = FakeEvent("this is a Keyword test")
+
+    state = {}
+    rule = KeywordsRule(("keyword", "test", "missing"), ignorecase=True)
+    assert await rule(event, state)
+    assert set(state[KEYWORD_KEY]) == {"keyword", "test"}
+
+    state = {}
+    rule = KeywordsRule(("keyword",))
+    assert not await rule(event, state)
+    assert KEYWORD_KEY not in state
+
+    state = {}
+    seg = MySeg(type="image", data={"file": "a.png"})
+    event = FakeEvent("hello", segments=[MySeg.from_str("hello"), seg])
+    rule = KeywordsRule((seg, "bye"))
+    assert await rule(event, state)
+    assert state[KEYWORD_KEY] == (seg,)
+
+    state = {}
+    rule = KeywordsRule(("", "bye"))
+    assert await rule(event, state)
+    assert state[KEYWORD_KEY] == ("",)
+
+    state = {}
+    rule = KeywordsRule(("",))
+    assert not await rule(FakeEvent(""), state)
+    assert KEYWORD_KEY not in state
+
+
 """@pytest.mark.anyio
 async def test_fullmatch_keywords():
     state = {}